@@ -1,5 +1,7 @@
 import unittest
 from unittest.mock import MagicMock
+
+import models
 from models import (
     UserRegistry,
     RestaurantDatabase,
@@ -40,6 +42,19 @@ class UserRegistrationTests(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["message"], "Email already registered")
 
+    def test_colliding_hash_keys_keep_both_users(self):
+        # Force every email onto the same 64-bit key to simulate a
+        # collision between distinct addresses.
+        self.registry._key = lambda email: 42
+        self.assertTrue(self.registry.register("a@example.com", "secret1", "secret1")["success"])
+        self.assertTrue(self.registry.register("b@example.com", "secret1", "secret1")["success"])
+        self.assertTrue(self.registry.is_registered("a@example.com"))
+        self.assertTrue(self.registry.is_registered("b@example.com"))
+        for email in ("a@example.com", "b@example.com"):
+            result = self.registry.register(email, "secret1", "secret1")
+            self.assertFalse(result["success"])
+            self.assertEqual(result["message"], "Email already registered")
+
 
 class RestaurantBrowsingTests(unittest.TestCase):
     def setUp(self):
@@ -68,6 +83,26 @@ class RestaurantBrowsingTests(unittest.TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].name, "Sushi Bar")
 
+    def test_search_without_numba_uses_specialized_filter(self):
+        # _filter_rows checks models.njit at call time, so disabling it
+        # here routes the query through the exec-specialized NumPy path.
+        self.addCleanup(setattr, models, "njit", models.njit)
+        models.njit = None
+        results = self.browsing.search(cuisine="Japanese", location="Downtown")
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].name, "Sushi Bar")
+        self.assertEqual(len(self.browsing.search(location="Downtown")), 2)
+        self.assertEqual(len(self.browsing.search()), 3)
+
+    def test_search_results_refresh_after_insert(self):
+        # The memoized search is keyed on the database version, so an
+        # insert must show up in an otherwise identical repeat query.
+        self.assertEqual(len(self.browsing.search(cuisine="Italian")), 1)
+        self.db.add_restaurant(Restaurant("Pasta Corner", "Italian", "Uptown", 4.1))
+        results = self.browsing.search(cuisine="Italian")
+        self.assertEqual(len(results), 2)
+        self.assertEqual({r.name for r in results}, {"Pizza Place", "Pasta Corner"})
+
 
 class CartAndOrderPlacementTests(unittest.TestCase):
     def setUp(self):
@@ -82,6 +117,15 @@ class CartAndOrderPlacementTests(unittest.TestCase):
         self.cart.add_item("Burger", 8.5, quantity=1)
         self.assertAlmostEqual(self.cart.total(), 28.5)
 
+    def test_total_cents_is_exact(self):
+        self.cart.add_item("Pizza", 10.0, quantity=2)
+        self.cart.add_item("Burger", 8.5, quantity=1)
+        self.assertEqual(self.cart.total_cents(), 2850)
+
+    def test_menu_prices_stored_as_cents(self):
+        self.assertEqual(self.menu.available_items["Pizza"], 1000)
+        self.assertEqual(self.menu.available_items["Burger"], 850)
+
     def test_add_same_item_increases_quantity(self):
         self.cart.add_item("Pizza", 10.0, quantity=1)
         self.cart.add_item("Pizza", 10.0, quantity=2)
@@ -123,6 +167,21 @@ class PaymentProcessingTests(unittest.TestCase):
     def test_validate_credit_card_invalid_number(self):
         self.assertFalse(self.processor.validate_credit_card("123", "123"))
 
+    def test_validate_credit_card_rejects_non_ascii_digits(self):
+        # int() parses any Unicode decimal digit; only ASCII '0'-'9'
+        # may pass, regardless of where the foreign digit sits.
+        self.assertFalse(self.processor.validate_credit_card("４２４２４２４２４２４２４２４２", "123"))
+        self.assertFalse(self.processor.validate_credit_card("4242424242424٢42", "123"))
+        self.assertFalse(self.processor.validate_credit_card("4242424242424242", "１２３"))
+        self.assertFalse(self.processor.validate_credit_card("4242424242424242", "1०3"))
+
+    def test_validate_credit_card_rejects_lax_int_forms(self):
+        # Forms int() tolerates but a card field must not.
+        self.assertFalse(self.processor.validate_credit_card(" 424242424242424", "123"))
+        self.assertFalse(self.processor.validate_credit_card("+424242424242424", "123"))
+        self.assertFalse(self.processor.validate_credit_card("42424242424_4242", "123"))
+        self.assertFalse(self.processor.validate_credit_card("4242424242424242", "12 "))
+
     def test_process_payment_success(self):
         # mock underlying method to force success
         self.payment_method.process_payment = MagicMock(return_value=True)
@@ -163,6 +222,23 @@ class OrderHistoryTests(unittest.TestCase):
         self.assertEqual(len(d16), 1)
         self.assertEqual(d16[0]["order_id"], "Order002")
 
+    def test_add_orders_bulk_ingest(self):
+        self.history.add_order("Order001", "Pizza", 25.0, "Delivered", "2023-09-15")
+        self.history.add_orders(
+            [
+                ("Order002", "Sushi", 20.0, "Pending", "2023-09-16"),
+                ("Order003", "Burger", 12.0, "Delivered", "2023-09-16"),
+            ]
+        )
+        orders = self.history.view_order_history()
+        self.assertEqual(len(orders), 3)
+        self.assertEqual(orders[2]["order_id"], "Order003")
+        delivered = self.history.filter_orders(status="Delivered")
+        self.assertEqual({o["order_id"] for o in delivered}, {"Order001", "Order003"})
+        both = self.history.filter_orders(status="Delivered", date="2023-09-16")
+        self.assertEqual(len(both), 1)
+        self.assertEqual(both[0]["order_id"], "Order003")
+
 
 if __name__ == "__main__":
     unittest.main()